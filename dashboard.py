@@ -1,8 +1,10 @@
+import os
+
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from plotly.colors import qualitative
 
 
 # ==================== PAGE CONFIG ====================
@@ -14,105 +16,111 @@ st.set_page_config(
 )
 
 # ==================== CUSTOM CSS FOR COLORFUL DESIGN ====================
-st.markdown("""
-    <style>
-    /* Main background gradient */
-    .main {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    /* Sidebar styling */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #2c3e50 0%, #3498db 100%);
-    }
-    
-    /* KPI cards */
-    .kpi-card {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        padding: 20px;
-        border-radius: 15px;
-        color: white;
-        text-align: center;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-        margin: 10px 0;
-    }
-    
-    .kpi-value {
-        font-size: 2.5rem;
-        font-weight: bold;
-        margin: 10px 0;
-    }
-    
-    .kpi-label {
-        font-size: 1rem;
-        opacity: 0.9;
-        text-transform: uppercase;
-        letter-spacing: 2px;
-    }
-    
-    /* Headers */
-    h1, h2, h3 {
-        color: white !important;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    /* Filter labels */
-    .stSelectbox label, .stMultiSelect label {
-        color: white !important;
-        font-weight: bold;
-    }
-    
-    /* Tabs */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 10px;
-        background: rgba(255,255,255,0.1);
-        border-radius: 10px;
-        padding: 10px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border-radius: 8px;
-        padding: 10px 20px;
-        font-weight: bold;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-    }
-    </style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_css():
+    """Read the dashboard stylesheet once per server process"""
+    with open(os.path.join(os.path.dirname(__file__), 'style.css')) as f:
+        return f"<style>{f.read()}</style>"
+
+st.markdown(load_css(), unsafe_allow_html=True)
+
+# Read-only ranked bar charts skip Plotly's hover/zoom event wiring
+STATIC_CHART_CONFIG = {'staticPlot': True}
+
+# Upper bound on points drawn per trend line; longer series are thinned evenly
+MAX_TREND_POINTS = 2000
+
+# LPI indicator columns and their display labels
+LPI_COLUMNS = ('LPI_CUSTOM', 'LPI_INFRA', 'LPI_EASE', 'LPI_QUALITY', 'LPI_TRACK', 'LPI_TIME')
+LPI_LABELS = ('Customs', 'Infrastructure', 'Ease of Shipment', 'Service Quality', 'Tracking', 'Timeliness')
 
 # ==================== LOAD DATA ====================
-@st.cache_data
-def load_data():
-    """Load and prepare the dataset"""
-    df = df = pd.read_excel('Oc_data.xlsx')
+DATA_XLSX = 'Oc_data.xlsx'
+DATA_PARQUET = 'Oc_data.parquet'
+
+@st.cache_data(persist="disk")
+def load_data(source_mtime):
+    """Load and prepare the dataset.
+
+    source_mtime is the xlsx modification time; as an argument it is part of
+    the cache key, so the persisted cache is invalidated when the sheet changes.
+    """
+    # Parse the Excel sheet once and keep a Parquet copy next to it;
+    # later cold starts read the columnar file instead of going through openpyxl.
+    # The Parquet copy is only an accelerator: any problem with it falls back to the sheet.
+    df = None
+    if (os.path.exists(DATA_PARQUET)
+            and os.path.getmtime(DATA_PARQUET) >= source_mtime):
+        try:
+            df = pd.read_parquet(DATA_PARQUET)
+        except Exception:
+            # Truncated/corrupt copy or no Parquet engine installed
+            df = None
+    if df is None:
+        df = pd.read_excel(DATA_XLSX)
+        # Write to a temp file and swap it in, so an interrupted write
+        # never leaves a partial Oc_data.parquet behind
+        tmp_path = DATA_PARQUET + '.tmp'
+        try:
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, DATA_PARQUET)
+        except (OSError, ImportError):
+            # Read-only checkout or no Parquet engine: keep the parsed sheet
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    # Compact dtypes: integer codes for Country, small ints for Year
+    df['Country'] = df['Country'].astype('category')
+    df['Year'] = df['Year'].astype('int16')
+    
+    # Keep rows ordered by Year so each year is a contiguous block
+    df = df.sort_values('Year', kind='stable').reset_index(drop=True)
     
     # Calculate average LPI score
-    lpi_columns = ['LPI_CUSTOM', 'LPI_INFRA', 'LPI_EASE', 'LPI_QUALITY', 'LPI_TRACK', 'LPI_TIME']
-    df['Avg_LPI'] = df[lpi_columns].mean(axis=1)
+    lpi_values = df[list(LPI_COLUMNS)].to_numpy(dtype='float64')
+    df['Avg_LPI'] = np.nanmean(lpi_values, axis=1)
     
     # Calculate Trade per Capita
-    df['Trade_per_Capita'] = df['Total'] / df['Population']
+    df['Trade_per_Capita'] = df['Total'].to_numpy(dtype='float64') / df['Population'].to_numpy(dtype='float64')
+    
+    # Downcast numerics (after the derived columns are computed in float64);
+    # the dashboard only shows 2 decimals or billions, so float32 is plenty.
+    # Population is fractional in the source data, so it stays a float too.
+    float_cols = df.select_dtypes('float64').columns
+    df[float_cols] = df[float_cols].astype('float32')
     
     return df
 
 # Load data
 try:
-    df = load_data()
+    # Cheap stand-in for the frame's identity in the cached helpers below
+    data_version = os.path.getmtime(DATA_XLSX)
+    df = load_data(data_version)
     st.sidebar.success("✅ Data loaded successfully!")
 except Exception as e:
     st.error(f"❌ Error loading data: {e}")
     st.stop()
 
 # ==================== SIDEBAR - GLOBAL FILTERS ====================
+# The leading underscore keeps Streamlit from hashing the frame;
+# data_version (the xlsx mtime) is the cache key instead.
+@st.cache_data(show_spinner=False)
+def year_options(_df, data_version):
+    """Sorted list of years available in the dataset"""
+    return sorted(_df['Year'].unique().tolist())
+
+@st.cache_data(show_spinner=False)
+def country_options(_df, data_version):
+    """'All' followed by the sorted country names"""
+    return ['All'] + sorted(_df['Country'].cat.categories.tolist())
+
 st.sidebar.title("🌍 Global Trade & Logistics")
 st.sidebar.markdown("---")
 
 # Year Filter
-years = sorted(df['Year'].unique())
+years = year_options(df, data_version)
 selected_year = st.sidebar.selectbox(
     "📅 Select Year",
     options=years,
@@ -120,7 +128,7 @@ selected_year = st.sidebar.selectbox(
 )
 
 # Country Filter
-countries = ['All'] + sorted(df['Country'].unique().tolist())
+countries = country_options(df, data_version)
 selected_country = st.sidebar.multiselect(
     "🌏 Select Country/Countries",
     options=countries,
@@ -136,16 +144,129 @@ st.sidebar.info("""
 """)
 
 # ==================== FILTER DATA ====================
-def filter_data(df, year, countries):
-    """Apply filters to the dataset"""
-    filtered = df[df['Year'] == year].copy()
-    
-    if 'All' not in countries:
-        filtered = filtered[filtered['Country'].isin(countries)]
+@st.cache_data(show_spinner=False)
+def year_slices(_df, data_version):
+    """Map each year to its (start, stop) row range in the Year-sorted dataset"""
+    years = _df['Year'].to_numpy()
+    unique_years = np.unique(years)
+    starts = np.searchsorted(years, unique_years, side='left')
+    stops = np.searchsorted(years, unique_years, side='right')
+    return {int(y): (int(s), int(e)) for y, s, e in zip(unique_years, starts, stops)}
+
+@st.cache_data(show_spinner=False)
+def filter_data(_df, data_version, year, countries):
+    """Apply filters to the dataset (countries is a hashable, sorted tuple)"""
+    start, stop = year_slices(_df, data_version).get(int(year), (0, 0))
+    filtered = _df.iloc[start:stop]
     
-    return filtered
+    if 'All' in countries:
+        return filtered
+    if len(countries) == 1:
+        # Single country: a plain equality compare on the category codes
+        return filtered[filtered['Country'] == countries[0]]
+    return filtered[filtered['Country'].isin(countries)]
+
+@st.cache_data(show_spinner=False)
+def trade_aggregates(_df, data_version):
+    """Precomputed Export/Import totals: per year, and per (Country, Year)"""
+    # _df is already sorted by Year, so groups come out in year order without sorting
+    year_totals = _df.groupby('Year', sort=False, as_index=False)[['Export', 'Import']].sum()
+    by_country_year = _df.set_index(['Country', 'Year'])[['Export', 'Import']].sort_index()
+    return year_totals, by_country_year
+
+@st.cache_data(show_spinner=False)
+def export_import_by_year(_df, data_version, countries_key):
+    """Yearly Export/Import totals for the given countries (None means all)"""
+    year_totals, by_country_year = trade_aggregates(_df, data_version)
+    if countries_key is None:
+        return year_totals
+    sub = by_country_year.loc[list(countries_key)]
+    # Rows come back country-major, so this groupby keeps the default sort (at most six years)
+    return sub.groupby(level='Year').sum().reset_index()
+
+@st.cache_data(show_spinner=False)
+def lpi_components_long(_df, data_version, year, countries):
+    """Long-form (Country, Indicator, Score) LPI table for the given filters"""
+    wide = filter_data(_df, data_version, year, countries)[['Country', *LPI_COLUMNS]]
+    wide = wide.rename(columns=dict(zip(LPI_COLUMNS, LPI_LABELS)))
+    return wide.melt(id_vars='Country', var_name='Indicator', value_name='Score')
+
+@st.cache_data(show_spinner=False)
+def ols_fit(x, y):
+    """Least-squares line through (x, y); returns (slope, intercept)"""
+    slope, intercept = np.polyfit(x, y, 1)
+    return slope, intercept
+
+country_selection = tuple(sorted(selected_country))
+filtered_df = filter_data(df, data_version, selected_year, country_selection)
 
-filtered_df = filter_data(df, selected_year, selected_country)
+# Ascending row order for each ranked bar chart, from one argsort over the values
+rank_columns = ['Total', 'Trade Balance', 'Trade_per_Capita', 'Avg_LPI']
+rank_order = dict(zip(
+    rank_columns,
+    np.argsort(filtered_df[rank_columns].to_numpy(), axis=0, kind='stable').T
+))
+
+# ==================== LAYOUT HELPERS ====================
+def chart_row():
+    """Two equal-width columns for a side-by-side chart row"""
+    return st.columns(2)
+
+# ==================== KPI CARDS ====================
+def kpi_card(col, label, value, sublabel=None):
+    """Render a single KPI card into the given column"""
+    extra = f'<div class="kpi-label">{sublabel}</div>' if sublabel else ''
+    col.markdown(
+        f'<div class="kpi-card"><div class="kpi-label">{label}</div>'
+        f'<div class="kpi-value">{value}</div>{extra}</div>',
+        unsafe_allow_html=True
+    )
+
+# ==================== CHART HELPERS ====================
+def ranked_bar(data, value_col, title, value_label, colorscale):
+    """Horizontal bar chart of value_col by Country, coloured on the same values"""
+    values = data[value_col].to_numpy()
+    fig = go.Figure(go.Bar(
+        y=data['Country'].to_numpy(),
+        x=values,
+        orientation='h',
+        marker=dict(
+            color=values,
+            colorscale=colorscale,
+            showscale=True,
+            colorbar=dict(title=value_label)
+        )
+    ))
+    fig.update_layout(title=title, xaxis_title=value_label, template="plotly_dark", height=400)
+    return fig
+
+def bubble_scatter(data, x, y, size, title, x_label, y_label, palette, size_max=20):
+    """One WebGL marker trace per Country, sized by the size column"""
+    countries = data['Country'].to_numpy()
+    xs, ys, sizes = (data[c].to_numpy(dtype='float64') for c in (x, y, size))
+    sizeref = 2.0 * np.nanmax(sizes) / size_max ** 2 if len(sizes) else 1
+    
+    fig = go.Figure()
+    for i, name in enumerate(pd.unique(countries)):
+        mask = countries == name
+        fig.add_trace(go.Scattergl(
+            x=xs[mask],
+            y=ys[mask],
+            mode='markers',
+            name=name,
+            marker=dict(
+                size=sizes[mask],
+                sizemode='area',
+                sizeref=sizeref,
+                color=palette[i % len(palette)]
+            ),
+            hovertemplate=(
+                f"<b>{name}</b><br>{x_label}=%{{x}}<br>{y_label}=%{{y}}"
+                f"<br>{size}=%{{marker.size}}<extra></extra>"
+            )
+        ))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title=y_label, legend_title="Country")
+    return fig
 
 # ==================== MAIN HEADER ====================
 st.title("🌍 Global Trade & Logistics Analysis Dashboard")
@@ -167,43 +288,14 @@ with tab1:
         st.warning("⚠️ No data available for selected filters")
     else:
         # KPIs
+        total_export, total_import, trade_balance, total_trade = (
+            filtered_df[['Export', 'Import', 'Trade Balance', 'Total']].sum().to_numpy()
+        )
         col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            total_export = filtered_df['Export'].sum()
-            st.markdown(f"""
-                <div class="kpi-card">
-                    <div class="kpi-label">Total Export</div>
-                    <div class="kpi-value">${total_export/1e9:.2f}B</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            total_import = filtered_df['Import'].sum()
-            st.markdown(f"""
-                <div class="kpi-card">
-                    <div class="kpi-label">Total Import</div>
-                    <div class="kpi-value">${total_import/1e9:.2f}B</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            trade_balance = filtered_df['Trade Balance'].sum()
-            st.markdown(f"""
-                <div class="kpi-card">
-                    <div class="kpi-label">Trade Balance</div>
-                    <div class="kpi-value">${trade_balance/1e9:.2f}B</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            total_trade = filtered_df['Total'].sum()
-            st.markdown(f"""
-                <div class="kpi-card">
-                    <div class="kpi-label">Total Trade</div>
-                    <div class="kpi-value">${total_trade/1e9:.2f}B</div>
-                </div>
-            """, unsafe_allow_html=True)
+        kpi_card(col1, "Total Export", f"${total_export/1e9:.2f}B")
+        kpi_card(col2, "Total Import", f"${total_import/1e9:.2f}B")
+        kpi_card(col3, "Trade Balance", f"${trade_balance/1e9:.2f}B")
+        kpi_card(col4, "Total Trade", f"${total_trade/1e9:.2f}B")
         
         st.markdown("---")
         
@@ -211,20 +303,21 @@ with tab1:
         st.subheader("📈 Export & Import Trends Over Time")
         
         # Get time series data
-        if 'All' in selected_country:
-            time_df = df.groupby('Year')[['Export', 'Import']].sum().reset_index()
-        else:
-            time_df = df[df['Country'].isin(selected_country)].groupby('Year')[['Export', 'Import']].sum().reset_index()
+        countries_key = None if 'All' in selected_country else country_selection
+        time_df = export_import_by_year(df, data_version, countries_key)
+        if len(time_df) > MAX_TREND_POINTS:
+            step = -(-len(time_df) // MAX_TREND_POINTS)
+            time_df = time_df.iloc[::step]
         
         fig_trend = go.Figure()
-        fig_trend.add_trace(go.Scatter(
+        fig_trend.add_trace(go.Scattergl(
             x=time_df['Year'], 
             y=time_df['Export']/1e9,
             name='Export',
             line=dict(color='#00d2ff', width=3),
             mode='lines+markers'
         ))
-        fig_trend.add_trace(go.Scatter(
+        fig_trend.add_trace(go.Scattergl(
             x=time_df['Year'], 
             y=time_df['Import']/1e9,
             name='Import',
@@ -242,37 +335,29 @@ with tab1:
         st.plotly_chart(fig_trend, use_container_width=True)
         
         # Charts Row 2: Trade by Country and Trade Balance
-        col1, col2 = st.columns(2)
+        col1, col2 = chart_row()
         
         with col1:
             st.subheader("🌏 Total Trade by Country")
-            fig_country = px.bar(
-                filtered_df.sort_values('Total', ascending=True),
-                y='Country',
-                x='Total',
-                orientation='h',
+            fig_country = ranked_bar(
+                filtered_df.iloc[rank_order['Total']],
+                'Total',
                 title=f"Total Trade by Country ({selected_year})",
-                labels={'Total': 'Total Trade (USD)', 'Country': ''},
-                color='Total',
-                color_continuous_scale='Viridis'
+                value_label='Total Trade (USD)',
+                colorscale='Viridis'
             )
-            fig_country.update_layout(template="plotly_dark", height=400)
-            st.plotly_chart(fig_country, use_container_width=True)
+            st.plotly_chart(fig_country, use_container_width=True, config=STATIC_CHART_CONFIG)
         
         with col2:
             st.subheader("⚖️ Trade Balance by Country")
-            fig_balance = px.bar(
-                filtered_df.sort_values('Trade Balance'),
-                y='Country',
-                x='Trade Balance',
-                orientation='h',
+            fig_balance = ranked_bar(
+                filtered_df.iloc[rank_order['Trade Balance']],
+                'Trade Balance',
                 title=f"Trade Balance by Country ({selected_year})",
-                labels={'Trade Balance': 'Trade Balance (USD)', 'Country': ''},
-                color='Trade Balance',
-                color_continuous_scale='RdYlGn'
+                value_label='Trade Balance (USD)',
+                colorscale='RdYlGn'
             )
-            fig_balance.update_layout(template="plotly_dark", height=400)
-            st.plotly_chart(fig_balance, use_container_width=True)
+            st.plotly_chart(fig_balance, use_container_width=True, config=STATIC_CHART_CONFIG)
 
 # ==================== PAGE 2: ECONOMIC CONTEXT ====================
 with tab2:
@@ -282,86 +367,60 @@ with tab2:
         st.warning("⚠️ No data available for selected filters")
     else:
         # KPIs
+        total_gdp, total_pop, total_trade = (
+            filtered_df[['GDP', 'Population', 'Total']].sum().to_numpy()
+        )
         col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            total_gdp = filtered_df['GDP'].sum()
-            st.markdown(f"""
-                <div class="kpi-card">
-                    <div class="kpi-label">Total GDP</div>
-                    <div class="kpi-value">${total_gdp/1e9:.2f}B</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            total_pop = filtered_df['Population'].sum()
-            st.markdown(f"""
-                <div class="kpi-card">
-                    <div class="kpi-label">Total Population</div>
-                    <div class="kpi-value">{total_pop/1e6:.2f}M</div>
-                </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            avg_trade_per_capita = (filtered_df['Total'].sum() / filtered_df['Population'].sum())
-            st.markdown(f"""
-                <div class="kpi-card">
-                    <div class="kpi-label">Avg Trade per Capita</div>
-                    <div class="kpi-value">${avg_trade_per_capita:,.0f}</div>
-                </div>
-            """, unsafe_allow_html=True)
+        kpi_card(col1, "Total GDP", f"${total_gdp/1e9:.2f}B")
+        kpi_card(col2, "Total Population", f"{total_pop/1e6:.2f}M")
+        avg_trade_per_capita = total_trade / total_pop
+        kpi_card(col3, "Avg Trade per Capita", f"${avg_trade_per_capita:,.0f}")
         
         st.markdown("---")
         
         # Charts Row 1: GDP vs Trade
         st.subheader("📊 GDP vs Total Trade")
-        fig_gdp_trade = px.scatter(
+        fig_gdp_trade = bubble_scatter(
             filtered_df,
             x='GDP',
             y='Total',
             size='Population',
-            color='Country',
-            hover_name='Country',
             title=f"GDP vs Total Trade ({selected_year})",
-            labels={'GDP': 'GDP (USD)', 'Total': 'Total Trade (USD)'},
-            color_discrete_sequence=px.colors.qualitative.Vivid
+            x_label='GDP (USD)',
+            y_label='Total Trade (USD)',
+            palette=qualitative.Vivid
         )
         fig_gdp_trade.update_layout(template="plotly_dark", height=500)
         st.plotly_chart(fig_gdp_trade, use_container_width=True)
         
         # Charts Row 2: Population vs Trade and Trade per Capita
-        col1, col2 = st.columns(2)
+        col1, col2 = chart_row()
         
         with col1:
             st.subheader("👥 Population vs Trade")
-            fig_pop_trade = px.scatter(
+            fig_pop_trade = bubble_scatter(
                 filtered_df,
                 x='Population',
                 y='Total',
                 size='GDP',
-                color='Country',
-                hover_name='Country',
                 title=f"Population vs Trade ({selected_year})",
-                labels={'Population': 'Population', 'Total': 'Total Trade (USD)'},
-                color_discrete_sequence=px.colors.qualitative.Bold
+                x_label='Population',
+                y_label='Total Trade (USD)',
+                palette=qualitative.Bold
             )
             fig_pop_trade.update_layout(template="plotly_dark", height=400)
             st.plotly_chart(fig_pop_trade, use_container_width=True)
         
         with col2:
             st.subheader("💵 Trade per Capita by Country")
-            fig_per_capita = px.bar(
-                filtered_df.sort_values('Trade_per_Capita', ascending=True),
-                y='Country',
-                x='Trade_per_Capita',
-                orientation='h',
+            fig_per_capita = ranked_bar(
+                filtered_df.iloc[rank_order['Trade_per_Capita']],
+                'Trade_per_Capita',
                 title=f"Trade per Capita ({selected_year})",
-                labels={'Trade_per_Capita': 'Trade per Capita (USD)', 'Country': ''},
-                color='Trade_per_Capita',
-                color_continuous_scale='Plasma'
+                value_label='Trade per Capita (USD)',
+                colorscale='Plasma'
             )
-            fig_per_capita.update_layout(template="plotly_dark", height=400)
-            st.plotly_chart(fig_per_capita, use_container_width=True)
+            st.plotly_chart(fig_per_capita, use_container_width=True, config=STATIC_CHART_CONFIG)
 
 # ==================== PAGE 3: LOGISTICS PERFORMANCE ====================
 with tab3:
@@ -374,32 +433,24 @@ with tab3:
         avg_lpi = filtered_df['Avg_LPI'].mean()
         
         col1, col2, col3 = st.columns([1, 1, 1])
-        with col2:
-            st.markdown(f"""
-                <div class="kpi-card">
-                    <div class="kpi-label">Average LPI Score</div>
-                    <div class="kpi-value">{avg_lpi:.2f}</div>
-                    <div class="kpi-label">Out of 5.0</div>
-                </div>
-            """, unsafe_allow_html=True)
+        kpi_card(col2, "Average LPI Score", f"{avg_lpi:.2f}", "Out of 5.0")
         
         st.markdown("---")
         
         # Charts Row 1: LPI Indicators Comparison (Radar Chart)
         st.subheader("📡 LPI Indicators Comparison")
         
-        lpi_cols = ['LPI_CUSTOM', 'LPI_INFRA', 'LPI_EASE', 'LPI_QUALITY', 'LPI_TRACK', 'LPI_TIME']
-        lpi_labels = ['Customs', 'Infrastructure', 'Ease of Shipment', 'Service Quality', 'Tracking', 'Timeliness']
-        
         # Create radar chart for each country
         fig_radar = go.Figure()
         
-        for _, row in filtered_df.iterrows():
+        lpi_matrix = filtered_df[list(LPI_COLUMNS)].to_numpy()
+        country_names = filtered_df['Country'].to_numpy()
+        for i in range(len(country_names)):
             fig_radar.add_trace(go.Scatterpolar(
-                r=[row[col] for col in lpi_cols],
-                theta=lpi_labels,
+                r=lpi_matrix[i].tolist(),
+                theta=LPI_LABELS,
                 fill='toself',
-                name=row['Country']
+                name=country_names[i]
             ))
         
         fig_radar.update_layout(
@@ -414,56 +465,71 @@ with tab3:
         st.plotly_chart(fig_radar, use_container_width=True)
         
         # Charts Row 2: LPI vs Export and LPI by Country
-        col1, col2 = st.columns(2)
+        col1, col2 = chart_row()
         
         with col1:
             st.subheader("📈 Average LPI vs Export Value")
-            fig_lpi_export = px.scatter(
+            fig_lpi_export = bubble_scatter(
                 filtered_df,
                 x='Avg_LPI',
                 y='Export',
                 size='GDP',
-                color='Country',
-                hover_name='Country',
                 title=f"LPI Score vs Export ({selected_year})",
-                labels={'Avg_LPI': 'Average LPI Score', 'Export': 'Export Value (USD)'},
-                color_discrete_sequence=px.colors.qualitative.Set2,
-                trendline="ols"
+                x_label='Average LPI Score',
+                y_label='Export Value (USD)',
+                palette=qualitative.Set2
             )
+            
+            # Overall OLS trendline, fitted with NumPy instead of statsmodels
+            lpi_x = filtered_df['Avg_LPI'].to_numpy(dtype='float64')
+            export_y = filtered_df['Export'].to_numpy(dtype='float64')
+            if len(np.unique(lpi_x)) > 1:
+                slope, intercept = ols_fit(lpi_x, export_y)
+                xs = np.array([lpi_x.min(), lpi_x.max()])
+                fig_lpi_export.add_trace(go.Scattergl(
+                    x=xs,
+                    y=slope * xs + intercept,
+                    name='OLS trend',
+                    mode='lines',
+                    line=dict(color='white', dash='dash')
+                ))
             fig_lpi_export.update_layout(template="plotly_dark", height=400)
             st.plotly_chart(fig_lpi_export, use_container_width=True)
         
         with col2:
             st.subheader("🏆 Average LPI by Country")
-            fig_lpi_country = px.bar(
-                filtered_df.sort_values('Avg_LPI', ascending=True),
-                y='Country',
-                x='Avg_LPI',
-                orientation='h',
+            fig_lpi_country = ranked_bar(
+                filtered_df.iloc[rank_order['Avg_LPI']],
+                'Avg_LPI',
                 title=f"Average LPI Score by Country ({selected_year})",
-                labels={'Avg_LPI': 'Average LPI Score', 'Country': ''},
-                color='Avg_LPI',
-                color_continuous_scale='Turbo'
+                value_label='Average LPI Score',
+                colorscale='Turbo'
             )
-            fig_lpi_country.update_layout(template="plotly_dark", height=400)
-            st.plotly_chart(fig_lpi_country, use_container_width=True)
+            st.plotly_chart(fig_lpi_country, use_container_width=True, config=STATIC_CHART_CONFIG)
         
         # LPI Components Breakdown
         st.subheader("📊 Detailed LPI Components")
-        lpi_breakdown = filtered_df[['Country'] + lpi_cols].set_index('Country')
-        lpi_breakdown.columns = lpi_labels
-        
-        fig_components = px.bar(
-            lpi_breakdown.reset_index().melt(id_vars='Country', var_name='Indicator', value_name='Score'),
-            x='Country',
-            y='Score',
-            color='Indicator',
+        lpi_long = lpi_components_long(df, data_version, selected_year, country_selection)
+        indicators = lpi_long['Indicator'].to_numpy()
+        lpi_countries = lpi_long['Country'].to_numpy()
+        scores = lpi_long['Score'].to_numpy()
+        fig_components = go.Figure()
+        for i, label in enumerate(LPI_LABELS):
+            mask = indicators == label
+            fig_components.add_trace(go.Bar(
+                x=lpi_countries[mask],
+                y=scores[mask],
+                name=label,
+                marker_color=qualitative.Pastel[i % len(qualitative.Pastel)]
+            ))
+        fig_components.update_layout(
             barmode='group',
             title=f"LPI Components Breakdown ({selected_year})",
-            labels={'Score': 'LPI Score', 'Country': '', 'Indicator': 'LPI Indicator'},
-            color_discrete_sequence=px.colors.qualitative.Pastel
+            yaxis_title='LPI Score',
+            legend_title='LPI Indicator',
+            template="plotly_dark",
+            height=500
         )
-        fig_components.update_layout(template="plotly_dark", height=500)
         st.plotly_chart(fig_components, use_container_width=True)
 
 # ==================== FOOTER ====================